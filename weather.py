@@ -1,10 +1,26 @@
 import argparse
+import itertools
 import json
+import logging
+import math
+import os
+import random
 import sys
+import threading
 import time
-from typing import Optional, Tuple, List, Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, List, Dict, Iterable, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+log = logging.getLogger("weather")
 
 # Constants
 GEOCODE_API_URL = "https://geocoding-api.open-meteo.com/v1/search"
@@ -12,64 +28,241 @@ WEATHER_API_URL = "https://api.open-meteo.com/v1/forecast"
 DEFAULT_JSON_OUTPUT = "weather_output.json"
 DEFAULT_CSV_OUTPUT = "weather_output.csv"
 REQUEST_TIMEOUT_SECONDS = 10
+WARM_UP_TIMEOUT_SECONDS = 3
 RETRY_ATTEMPTS = 3
-RETRY_DELAY = 1.5
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 8
+RETRY_JITTER = 0.2
+MAX_CONCURRENT_REQUESTS = 10
+RATE_LIMIT_PER_SECOND = 10
+RATE_LIMIT_BURST = 10
+FORECAST_BATCH_SIZE = 100
+GEOCODE_CACHE_FILE = "geocache.json"
+GEOCODE_CACHE_TTL_SECONDS = 30 * 86400
+WEATHER_CACHE_TTL_SECONDS = 600
+WEATHER_CACHE_MAXSIZE = 1024
+NUMPY_STATS_THRESHOLD = 10000
+
+
+def _create_session() -> Tuple[object, Tuple[type, ...]]:
+    """
+    Creates a session that keeps connections to the Open-Meteo hosts alive.
+    When httpx is installed, an HTTP/2 client is used so concurrent requests
+    are multiplexed over a single connection per host.
+    Returns the session together with the exceptions its requests can raise.
+    """
+    try:
+        import h2  # noqa: F401  (required by httpx for HTTP/2)
+        import httpx
+    except ImportError:  # optional, requests over HTTP/1.1 is used otherwise
+        httpx = None
+
+    if httpx is not None:
+        log.debug("Using httpx with HTTP/2 for API requests")
+        client = httpx.Client(
+            http2=True, timeout=REQUEST_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4)
+        )
+        return client, (httpx.HTTPError, json.JSONDecodeError)
 
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=MAX_CONCURRENT_REQUESTS * 2,
+        max_retries=0
+    )
+    session.mount("https://api.open-meteo.com", adapter)
+    session.mount("https://geocoding-api.open-meteo.com", adapter)
+    log.debug("Using requests with HTTP/1.1 keep-alive for API requests")
+    return session, (requests.RequestException, json.JSONDecodeError)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: allows bursts up to `capacity`, then `rate` calls per second."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a token is available, then consumes it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
 
-def read_city_names_from_file(file_path: str) -> List[str]:
-    """Reads city names from a file. Note: City name should be on a separate line"""
+
+_session: Optional[Tuple[object, Tuple[type, ...]]] = None
+_session_lock = threading.Lock()
+_RATE_LIMITER = _TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+_geocode_cache: Optional[Dict[str, list]] = None
+_geocode_cache_lock = threading.Lock()
+_weather_cache: "OrderedDict[Tuple[float, float], Tuple[dict, float]]" = OrderedDict()
+_weather_cache_lock = threading.Lock()
+
+
+def _get_session() -> Tuple[object, Tuple[type, ...]]:
+    """
+    Returns the shared HTTP session and its request exceptions, creating them
+    on first use.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _create_session()
+        return _session
+
+
+def _get_geocode_cache() -> Dict[str, list]:
+    """Loads the on-disk geocoding cache once per process."""
+    global _geocode_cache
+    with _geocode_cache_lock:
+        if _geocode_cache is None:
+            try:
+                with open(GEOCODE_CACHE_FILE, "r", encoding="utf-8") as file:
+                    _geocode_cache = json.load(file)
+            except (OSError, ValueError):
+                _geocode_cache = {}
+            if not isinstance(_geocode_cache, dict):
+                _geocode_cache = {}
+        return _geocode_cache
+
+
+def save_geocode_cache() -> None:
+    """Writes the geocoding cache back to disk if it was loaded."""
+    with _geocode_cache_lock:
+        if _geocode_cache is None:
+            return
+        try:
+            tmp_path = f"{GEOCODE_CACHE_FILE}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(_geocode_cache, file, ensure_ascii=False)
+            os.replace(tmp_path, GEOCODE_CACHE_FILE)
+        except OSError as e:
+            log.warning("Failed to save geocoding cache: %s", e)
+
+
+def iter_city_names(file_path: str) -> Iterator[str]:
+    """Yields city names from a file as they are read. Note: City name should be on a separate line"""
     try:
+        found = False
         with open(file_path, "r", encoding="utf-8") as file:
-            cities = [line.strip() for line in file if line.strip()]
-
-        if not cities:
-            print(
-                f"[warning] The file '{file_path}' was read, but no cities were found.",
-                file=sys.stderr
+            for line in file:
+                city = line.strip()
+                if city:
+                    found = True
+                    yield city
+
+        if not found:
+            log.warning(
+                "The file '%s' was read, but no cities were found.", file_path
             )
-        return cities
     except FileNotFoundError:
-        print(f"[error] Could not find file: {file_path}", file=sys.stderr)
+        log.error("Could not find file: %s", file_path)
         raise
     except Exception as e:
-        print(
-            f"[error] Unexpected error reading the file '{file_path}': {e}",
-            file=sys.stderr
-        )
+        log.error("Unexpected error reading the file '%s': %s", file_path, e)
         raise
 
 
+def _warm_up_connection(url: str) -> None:
+    session, request_errors = _get_session()
+    try:
+        _RATE_LIMITER.acquire()
+        session.head(url, timeout=WARM_UP_TIMEOUT_SECONDS)
+    except request_errors as e:
+        log.debug("Warm-up request to %s failed: %s", url, e)
+
+
+def warm_up_forecast_connection() -> None:
+    """
+    Opens a connection to the forecast host in the background so its DNS and
+    TLS setup overlaps with geocoding. The geocoding host is not warmed up, as
+    the real geocoding requests start right away and would only race it.
+    """
+    threading.Thread(
+        target=_warm_up_connection, args=(WEATHER_API_URL,), daemon=True
+    ).start()
+
+
+def read_city_names_from_file(file_path: str) -> List[str]:
+    """Reads city names from a file. Note: City name should be on a separate line"""
+    return list(iter_city_names(file_path))
+
+
 def fetch_data_with_retries(
     url: str, params: dict, retries: int = RETRY_ATTEMPTS
 ) -> Optional[dict]:
     """For HTTP requests"""
+    session, request_errors = _get_session()
     for attempt in range(1, retries + 1):
         try:
-            response = requests.get(
+            _RATE_LIMITER.acquire()
+            response = session.get(
                 url, params=params, timeout=REQUEST_TIMEOUT_SECONDS
             )
             response.raise_for_status()
+            if orjson is not None:
+                return orjson.loads(response.content)
             return response.json()
-        except requests.RequestException as err:
+        except request_errors as err:
+            # JSONDecodeError covers bodies orjson could not decode
+            # (orjson.JSONDecodeError is a subclass of it)
+            err_response = getattr(err, "response", None)
+            status = err_response.status_code if err_response is not None else None
+            if status is not None and 400 <= status < 500 and status != 429:
+                log.error(
+                    "Request failed with non-retriable status %s: %s", status, err
+                )
+                return None
             if attempt < retries:
-                print(
-                    f"[info] Request failed (attempt {attempt}): {err}. Retrying...",
-                    file=sys.stderr
+                log.info(
+                    "Request failed (attempt %d): %s. Retrying...", attempt, err
                 )
-                time.sleep(RETRY_DELAY)
+                delay = min(RETRY_BACKOFF_BASE * 2 ** (attempt - 1), RETRY_BACKOFF_MAX)
+                time.sleep(delay + random.random() * RETRY_JITTER)
             else:
-                print(
-                    f"[error] Failed after {attempt} retries: {err}",
-                    file=sys.stderr
-                )
+                log.error("Failed after %d retries: %s", attempt, err)
                 return None
 
 
+def _normalize_city_name(city_name: str) -> str:
+    """Returns the key used to cache and deduplicate city names."""
+    return city_name.strip().casefold()
+
+
 def get_city_coordinates(city_name: str) -> Optional[Tuple[float, float, str]]:
     """
     Fetches latitude and longitude for a given city name.
     Returns a tuple (latitude, longitude, city_name) if successful, or None if not.
+    Results are cached on disk, keyed by the normalized city name.
     """
+    cache = _get_geocode_cache()
+    key = _normalize_city_name(city_name)
+    cached = cache.get(key)
+    # Malformed entries (e.g. from a hand-edited file) count as misses
+    if (
+        isinstance(cached, list) and len(cached) == 4
+        and isinstance(cached[0], (int, float))
+        and isinstance(cached[1], (int, float))
+        and isinstance(cached[2], str)
+        and isinstance(cached[3], (int, float))
+        and time.time() - cached[3] < GEOCODE_CACHE_TTL_SECONDS
+    ):
+        log.debug("Geocoding cache hit for '%s'", city_name)
+        return cached[0], cached[1], cached[2]
+    log.debug("Geocoding cache miss for '%s'", city_name)
+
     params = {"name": city_name, "count": 1}
     response_data = fetch_data_with_retries(GEOCODE_API_URL, params)
 
@@ -78,10 +271,7 @@ def get_city_coordinates(city_name: str) -> Optional[Tuple[float, float, str]]:
 
     results = response_data.get("results")
     if not results:
-        print(
-            f"[warning] geocoding data not found for '{city_name}'.",
-            file=sys.stderr
-        )
+        log.warning("geocoding data not found for '%s'.", city_name)
         return None
 
     city_info = results[0]
@@ -89,36 +279,39 @@ def get_city_coordinates(city_name: str) -> Optional[Tuple[float, float, str]]:
     city_name_from_api = city_info.get("name") or city_name
 
     if lat is None or lon is None:
-        print(
-            f"[warning] Error in geocoding data for city '{city_name}'",
-            file=sys.stderr
-        )
+        log.warning("Error in geocoding data for city '%s'", city_name)
         return None
 
+    cache[key] = [lat, lon, city_name_from_api, int(time.time())]
     return lat, lon, city_name_from_api
 
 
-def get_current_weather_for_coordinates(lat: float, lon: float) -> Optional[
-    dict]:
+def _store_weather(key: Tuple[float, float], weather: dict, now: float) -> None:
     """
-    Fetches the current weather data for a given pair of latitude and longitude.
-    Returns a dictionary with weather data (temperature, windspeed, etc.) if successful, or None if not.
+    Adds an entry to the weather cache, dropping expired entries and then the
+    oldest ones once WEATHER_CACHE_MAXSIZE is exceeded.
     """
-    params = {
-        "latitude": lat,
-        "longitude": lon,
-        "current_weather": True
-    }
-    weather_data = fetch_data_with_retries(WEATHER_API_URL, params)
-
-    if not weather_data:
-        return None
-
+    with _weather_cache_lock:
+        _weather_cache[key] = (weather, now)
+        _weather_cache.move_to_end(key)
+        # Entries are kept in insertion order, so the oldest expire first
+        while _weather_cache:
+            _, (_, stored_at) = next(iter(_weather_cache.items()))
+            if now - stored_at < WEATHER_CACHE_TTL_SECONDS:
+                break
+            _weather_cache.popitem(last=False)
+        while len(_weather_cache) > WEATHER_CACHE_MAXSIZE:
+            _weather_cache.popitem(last=False)
+
+
+def _parse_current_weather(
+    weather_data: dict, lat: float, lon: float
+) -> Optional[dict]:
+    """Extracts the fields we use from a single forecast API result."""
     current_weather = weather_data.get("current_weather")
     if not current_weather:
-        print(
-            f"[warning] No current weather data found for coordinates {lat}, {lon}.",
-            file=sys.stderr
+        log.warning(
+            "No current weather data found for coordinates %s, %s.", lat, lon
         )
         return None
 
@@ -131,11 +324,96 @@ def get_current_weather_for_coordinates(lat: float, lon: float) -> Optional[
     }
 
 
+def get_current_weather_for_locations(
+    coordinates: List[Tuple[float, float]]
+) -> List[Optional[dict]]:
+    """
+    Fetches the current weather for several (latitude, longitude) pairs in batched API requests.
+    Returns a list of weather dictionaries (or None) in the same order as the input.
+    Results are cached in memory for a few minutes, keyed by coordinates rounded to ~100 m.
+    """
+    keys = [(round(lat, 3), round(lon, 3)) for lat, lon in coordinates]
+
+    now = time.monotonic()
+    found: Dict[Tuple[float, float], dict] = {}
+    with _weather_cache_lock:
+        for key in keys:
+            cached = _weather_cache.get(key)
+            if cached and now - cached[1] < WEATHER_CACHE_TTL_SECONDS:
+                found[key] = cached[0]
+    # Each distinct location is requested once, even if it repeats in the input
+    missing = [key for key in dict.fromkeys(keys) if key not in found]
+
+    log.debug(
+        "Weather cache: %d hit(s), %d miss(es)", len(found), len(missing)
+    )
+
+    # Misses are fetched in fixed-size chunks to keep URLs short and to
+    # limit how many locations a single failed request can lose
+    for start in range(0, len(missing), FORECAST_BATCH_SIZE):
+        batch = missing[start:start + FORECAST_BATCH_SIZE]
+        params = {
+            "latitude": ",".join(str(lat) for lat, _ in batch),
+            "longitude": ",".join(str(lon) for _, lon in batch),
+            # Spelled out so requests and httpx send the same query string
+            "current_weather": "true"
+        }
+        weather_data = fetch_data_with_retries(WEATHER_API_URL, params)
+
+        if not weather_data:
+            continue
+
+        # The API returns a plain object for one location and a list for several
+        if isinstance(weather_data, dict):
+            weather_data = [weather_data]
+
+        now = time.monotonic()
+        for key, item in zip(batch, weather_data):
+            weather = _parse_current_weather(item, *key)
+            if weather:
+                found[key] = weather
+                _store_weather(key, weather, now)
+
+    return [found.get(key) for key in keys]
+
+
+def get_current_weather_for_coordinates(lat: float, lon: float) -> Optional[
+    dict]:
+    """
+    Fetches the current weather data for a given pair of latitude and longitude.
+    Returns a dictionary with weather data (temperature, windspeed, etc.) if successful, or None if not.
+    """
+    return get_current_weather_for_locations([(lat, lon)])[0]
+
+
 def compute_weather_stats(temperatures: List[float]) -> Dict[
     str, Optional[float]]:
-    """Computes basic stats (min, max, average) for a list of temperatures."""
+    """
+    Computes basic stats (min, max, average) for a list of temperatures.
+    NaN values are ignored on both the NumPy and the pure-Python path.
+    """
+    empty = {"min": None, "max": None, "average": None}
+
+    # NumPy (optional) only pays off for large inputs, so it is imported lazily
+    if len(temperatures) >= NUMPY_STATS_THRESHOLD:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            arr = np.asarray(temperatures, dtype=np.float64)
+            arr = arr[~np.isnan(arr)]
+            if not arr.size:
+                return empty
+            return {
+                "min": float(arr.min()),
+                "max": float(arr.max()),
+                "average": float(arr.mean()),
+            }
+
+    temperatures = [temp for temp in temperatures if not math.isnan(temp)]
     if not temperatures:
-        return {"min": None, "max": None, "average": None}
+        return empty
 
     min_temp = min(temperatures)
     max_temp = max(temperatures)
@@ -146,13 +424,20 @@ def compute_weather_stats(temperatures: List[float]) -> Dict[
 def save_to_json(file_path: str, data: dict) -> None:
     """Saves the given data to a JSON file with proper formatting."""
     try:
-        with open(file_path, "w", encoding="utf-8") as json_file:
-            json.dump(data, json_file, indent=4, ensure_ascii=False)
-        print(f"[info] Data successfully saved to {file_path}")
+        if orjson is not None:
+            with open(file_path, "wb") as json_file:
+                json_file.write(
+                    orjson.dumps(
+                        data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                )
+        else:
+            with open(file_path, "w", encoding="utf-8") as json_file:
+                json.dump(data, json_file, indent=2, ensure_ascii=False)
+        log.info("Data successfully saved to %s", file_path)
     except Exception as e:
-        print(
-            f"[error] Failed to save data to {file_path}: {e}", file=sys.stderr
-        )
+        log.error("Failed to save data to %s: %s", file_path, e)
 
 
 def save_to_csv(file_path: str, data: dict) -> None:
@@ -183,60 +468,78 @@ def save_to_csv(file_path: str, data: dict) -> None:
                 csv_file.write("\n# Statistics\n")
                 for key, value in stats.items():
                     csv_file.write(f"# {key}: {value}\n")
-        print(f"[info] Data successfully saved to {file_path}")
+        log.info("Data successfully saved to %s", file_path)
     except Exception as e:
-        print(
-            f"[error] Failed to save data to {file_path}: {e}", file=sys.stderr
-        )
+        log.error("Failed to save data to %s: %s", file_path, e)
 
 
 def print_weather_summary(data: dict) -> None:
     if not data:
-        print("[info] No data to display.")
+        log.info("No data to display.")
         return
 
-    print("\n--- Weather Summary ---")
-    temperatures = []
+    # The summary is built up front and written in one go
+    lines = ["\n--- Weather Summary ---\n"]
     for city, weather_info in data.items():
         if city == "stats":
             continue
-        temp = weather_info.get("temperature")
-        temperatures.append(temp if temp is not None else float("nan"))
-        print(
-            f"{city:20}  Temp: {temp}°C  Wind Speed: {weather_info.get('windspeed')} km/h  Time: {weather_info.get('timestamp')}"
+        lines.append(
+            f"{city:20}  Temp: {weather_info['temperature']}°C  Wind Speed: {weather_info['windspeed']} km/h  Time: {weather_info['timestamp']}\n"
         )
 
     stats = data.get("stats")
     if stats:
-        print("\nStatistics:")
-        print(f"  Max Temp: {stats.get('max')}°C")
-        print(f"  Min Temp: {stats.get('min')}°C")
-        print(
-            f"  Avg Temp: {stats.get('average'):.2f}°C" if stats.get(
-                "average"
-            ) else "  Avg Temp: n/a"
+        average = stats.get("average")
+        lines.append("\nStatistics:\n")
+        lines.append(f"  Max Temp: {stats.get('max')}°C\n")
+        lines.append(f"  Min Temp: {stats.get('min')}°C\n")
+        lines.append(
+            f"  Avg Temp: {average:.2f}°C\n" if average else "  Avg Temp: n/a\n"
         )
-    print("------------------------\n")
+    lines.append("------------------------\n\n")
+    sys.stdout.write("".join(lines))
+
+
+def geocode_city(city: str) -> Optional[Tuple[float, float, str]]:
+    """Geocodes a city, reporting when it has to be skipped."""
+    log.info("Fetching data for %s...", city)
+    coordinates = get_city_coordinates(city)
+    if not coordinates:
+        log.warning("Skipping %s due to geocoding issues.", city)
+    return coordinates
 
 
 def process_weather_for_cities(
-    cities: List[str], output_format: str = "json",
+    cities: Iterable[str], output_format: str = "json",
     output_file: Optional[str] = None
 ) -> dict:
     weather_results = {}
     temperatures = []
 
-    for city in cities:
-        print(f"[info] Fetching data for {city}...")
-        coordinates = get_city_coordinates(city)
-        if not coordinates:
-            print(f"[warn] Skipping {city} due to geocoding issues.")
-            continue
-        lat, lon, city_name = coordinates
+    # Cities are geocoded concurrently as they are read, so lookups start
+    # before the whole input has been consumed. Duplicates are fetched once.
+    unique_cities = {}
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        for city in cities:
+            key = _normalize_city_name(city)
+            if key not in unique_cities:
+                unique_cities[key] = (city, executor.submit(geocode_city, city))
+    cities = [city for city, _ in unique_cities.values()]
+    geocoded = [future.result() for _, future in unique_cities.values()]
+    save_geocode_cache()
+
+    located = [
+        (city, coordinates) for city, coordinates in zip(cities, geocoded)
+        if coordinates
+    ]
+    # Forecasts are requested in batches rather than one call per city
+    weathers = get_current_weather_for_locations(
+        [(lat, lon) for _, (lat, lon, _) in located]
+    )
 
-        weather = get_current_weather_for_coordinates(lat, lon)
+    for (city, (_, _, city_name)), weather in zip(located, weathers):
         if not weather:
-            print(f"[warn] No weather data available for {city}.")
+            log.warning("No weather data available for %s.", city)
             continue
 
         weather_results[city_name] = {
@@ -249,8 +552,6 @@ def process_weather_for_cities(
         if weather["temperature"] is not None:
             temperatures.append(weather["temperature"])
 
-        time.sleep(0.5)
-
     stats = compute_weather_stats(temperatures)
     weather_results["stats"] = stats
 
@@ -263,8 +564,10 @@ def process_weather_for_cities(
     return weather_results
 
 
-def parse_arguments(argv: List[str]) -> argparse.Namespace:
-    """Parses command-line arguments."""
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Weather Data Fetcher and Analyzer"
     )
@@ -277,26 +580,63 @@ def parse_arguments(argv: List[str]) -> argparse.Namespace:
         "--out",
         help="Path to the output file (defaults to 'weather_output.json' or 'weather_output.csv')"
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--quiet", action="store_true",
+        help="Only report warnings and errors"
+    )
+    return parser
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser once and reuses it for later calls."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """Parses command-line arguments."""
+    return _get_parser().parse_args(argv)
 
 
 def main(argv: List[str] = None) -> int:
     args = parse_arguments(argv or sys.argv[1:])
+    # basicConfig only installs a handler once; the level is set on our own
+    # logger on every call so --quiet works for repeated main() calls too
+    logging.basicConfig(format="[%(levelname)s] %(message)s", stream=sys.stderr)
+    log.setLevel(logging.WARNING if args.quiet else logging.INFO)
+    cities = iter_city_names(args.file)
     try:
-        cities = read_city_names_from_file(args.file)
+        first_city = next(cities)
+    except StopIteration:
+        log.error("Please add city names to the file")
+        return 3
     except Exception as e:
         return 2
 
-    if not cities:
-        print("[error] Please add city names to the file", file=sys.stderr)
-        return 3
+    warm_up_forecast_connection()
+
+    # The file is still being read while cities are processed, so read
+    # errors are recorded here to keep reporting them with exit code 2
+    read_errors = []
+
+    def remaining_cities() -> Iterator[str]:
+        try:
+            yield from cities
+        except Exception as e:
+            read_errors.append(e)
+            raise
 
     try:
         process_weather_for_cities(
-            cities, output_format=args.format, output_file=args.out
+            itertools.chain([first_city], remaining_cities()),
+            output_format=args.format, output_file=args.out
         )
     except Exception as e:
-        print(f"[error] Something went wrong: {e}", file=sys.stderr)
+        if read_errors:
+            return 2
+        log.error("Something went wrong: %s", e)
         return 1
 
     return 0